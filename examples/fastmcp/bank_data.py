@@ -5,9 +5,12 @@ A demonstration of bank data management using FastMCP.
 Provides tools for account management, transactions, and balance inquiries.
 """
 
+import functools
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from decimal import Decimal
+from itertools import count
 from typing import Annotated
 
 from pydantic import Field
@@ -17,44 +20,138 @@ from mcp.server.fastmcp import FastMCP
 # Create the MCP server
 mcp = FastMCP("Bank Data Server")
 
-
-@dataclass
-class Transaction:
-    """Represents a bank transaction."""
-
-    id: str
-    account_id: str
-    amount: Decimal
-    transaction_type: str  # "deposit", "withdrawal", "transfer_in", "transfer_out"
-    timestamp: datetime
-    description: str
-
-
-@dataclass
+# Canonical transaction-type strings, interned so every comparison against
+# them is a pointer check rather than a character-by-character compare.
+DEPOSIT = sys.intern("deposit")
+WITHDRAWAL = sys.intern("withdrawal")
+TRANSFER_IN = sys.intern("transfer_in")
+TRANSFER_OUT = sys.intern("transfer_out")
+
+
+def _utcnow() -> datetime:
+    """Current UTC time; fromtimestamp skips the tz-detection detour in datetime.now."""
+    return datetime.fromtimestamp(time.time(), timezone.utc)
+
+
+@dataclass(slots=True, repr=False)
+class TransactionLog:
+    """Column-oriented (struct-of-arrays) storage for an account's transactions.
+
+    Parallel lists keep each column contiguous, so history queries and
+    aggregates scan sequential memory instead of chasing per-object pointers.
+    """
+
+    ids: list[str] = field(default_factory=lambda: [])
+    amounts: list[int] = field(default_factory=lambda: [])  # cents
+    types: list[str] = field(default_factory=lambda: [])  # DEPOSIT, WITHDRAWAL, TRANSFER_IN, TRANSFER_OUT
+    timestamps: list[datetime] = field(default_factory=lambda: [])
+    descriptions: list[str] = field(default_factory=lambda: [])
+    lines: list[str] = field(default_factory=lambda: [])  # display lines pre-formatted at insert time
+    # Secondary index: row positions per transaction type, for O(1) filtered queries
+    by_type: dict[str, list[int]] = field(default_factory=lambda: {})
+
+    def append(
+        self,
+        transaction_id: str,
+        amount: int,
+        transaction_type: str,
+        timestamp: datetime,
+        description: str,
+    ) -> None:
+        """Record one transaction by appending to every column."""
+        self.ids.append(transaction_id)
+        self.amounts.append(amount)
+        self.types.append(transaction_type)
+        self.timestamps.append(timestamp)
+        self.descriptions.append(description)
+        sign = "+" if transaction_type in (DEPOSIT, TRANSFER_IN) else "-"
+        self.lines.append(f"  {timestamp.strftime('%Y-%m-%d %H:%M')} | {sign}{_fmt_cents(amount)} | {description}")
+        self.by_type.setdefault(transaction_type, []).append(len(self.ids) - 1)
+
+    def rows_of_type(self, transaction_type: str) -> list[int]:
+        """Row positions of all transactions of the given type, oldest first."""
+        return self.by_type.get(transaction_type, [])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+@dataclass(slots=True, repr=False)
 class Account:
     """Represents a bank account."""
 
     id: str
     name: str
-    balance: Decimal = field(default_factory=lambda: Decimal("0.00"))
-    transactions: list["Transaction"] = field(default_factory=lambda: [])
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    balance: int = 0  # cents
+    transactions: TransactionLog = field(default_factory=TransactionLog)
+    created_at: datetime = field(default_factory=_utcnow)
+    fmt_line: str = ""  # cached bank://accounts line, refreshed on balance change
+
+    def refresh_fmt_line(self) -> None:
+        """Re-render the cached listing line after a balance change."""
+        self.fmt_line = f"{self.id}: {self.name} ({_fmt_cents(self.balance)})"
+
+
+# Response templates hoisted to module scope so their format specs are compiled once
+_ACCOUNT_INFO_TMPL = (
+    "Account ID: {id}\nName: {name}\nBalance: {balance}\nCreated: {created}\nTransaction count: {txn_count}"
+)
+_ACCOUNT_RESOURCE_TMPL = "Account: {id}\nHolder: {name}\nBalance: {balance}\nOpened: {opened}"
+_TRANSFER_RESULT_TMPL = (
+    "Transferred {amount} from {from_id} to {to_id}.\nSource balance: {source}\nDestination balance: {destination}"
+)
+_BALANCE_TMPL = "{dollars}.{cents:02d}"
 
+# In-memory storage for demonstration purposes. Accounts are keyed by their
+# numeric suffix: integer hashing is effectively free in CPython, unlike
+# hashing the 9-character display ID on every lookup.
+_accounts: dict[int, Account] = {}
+_transaction_counter = count(1)  # C-level counter; one next() call per ID
+_account_counter = count(1)
+# Rendered account listings, keyed by endpoint; cleared on any mutation so
+# repeated reads (the common MCP polling case) cost a single dict probe.
+_list_caches: dict[str, str] = {}
 
-# In-memory storage for demonstration purposes
-_accounts: dict[str, Account] = {}
-_transaction_counter: list[int] = [0]  # Using list to avoid global statement
+
+def _to_cents(amount: float) -> int:
+    """Convert a dollar amount to integer cents, rounding to the nearest cent."""
+    return round(amount * 100)
+
+
+def _fmt_cents(cents: int) -> str:
+    """Format an integer cent amount as a dollar string, e.g. 12345 -> "$123.45"."""
+    sign = "-" if cents < 0 else ""
+    cents = abs(cents)
+    return f"{sign}${cents // 100}.{cents % 100:02d}"
 
 
 def _generate_transaction_id() -> str:
     """Generate a unique transaction ID."""
-    _transaction_counter[0] += 1
-    return f"TXN{_transaction_counter[0]:06d}"
+    return f"TXN{next(_transaction_counter):06d}"
+
+
+def _parse_id(account_id: str) -> int | None:
+    """Parse the numeric key out of a canonical display ID like "ACC000001".
+
+    Only the exact form emitted by _generate_account_id is accepted, so
+    aliases like "ACC1" or "ACC0000001" stay "not found" as they always were.
+    """
+    if len(account_id) != 9 or not account_id.startswith("ACC"):
+        return None
+    suffix = account_id[3:]
+    return int(suffix) if suffix.isascii() and suffix.isdigit() else None
+
 
+def _lookup_account(account_id: str) -> Account | None:
+    """Resolve a display account ID to the stored account, if any."""
+    key = _parse_id(account_id)
+    return _accounts.get(key) if key is not None else None
 
-def _generate_account_id() -> str:
-    """Generate a unique account ID."""
-    return f"ACC{len(_accounts) + 1:06d}"
+
+def _generate_account_id() -> tuple[int, str]:
+    """Generate the next account key and its display ID."""
+    key = next(_account_counter)
+    return key, f"ACC{key:06d}"
 
 
 # ===== Tools for Account Management =====
@@ -63,29 +160,33 @@ def _generate_account_id() -> str:
 @mcp.tool()
 def create_account(
     name: Annotated[str, Field(description="Name of the account holder")],
-    initial_deposit: Annotated[float, Field(description="Initial deposit amount", ge=0)] = 0.0,
+    initial_deposit: float = 0.0,
 ) -> str:
     """Create a new bank account with an optional initial deposit."""
-    account_id = _generate_account_id()
+    if initial_deposit < 0:
+        return "Error: Initial deposit cannot be negative."
+
+    account_key, account_id = _generate_account_id()
+    initial_cents = _to_cents(initial_deposit)
     account = Account(
         id=account_id,
         name=name,
-        balance=Decimal(str(initial_deposit)),
+        balance=initial_cents,
     )
 
-    if initial_deposit > 0:
-        transaction = Transaction(
-            id=_generate_transaction_id(),
-            account_id=account_id,
-            amount=Decimal(str(initial_deposit)),
-            transaction_type="deposit",
-            timestamp=datetime.now(timezone.utc),
+    if initial_cents > 0:
+        account.transactions.append(
+            transaction_id=_generate_transaction_id(),
+            amount=initial_cents,
+            transaction_type=DEPOSIT,
+            timestamp=_utcnow(),
             description="Initial deposit",
         )
-        account.transactions.append(transaction)
 
-    _accounts[account_id] = account
-    return f"Account created successfully. Account ID: {account_id}, Balance: ${account.balance:.2f}"
+    account.refresh_fmt_line()
+    _accounts[account_key] = account
+    _list_caches.clear()
+    return f"Account created successfully. Account ID: {account_id}, Balance: {_fmt_cents(account.balance)}"
 
 
 @mcp.tool()
@@ -93,16 +194,17 @@ def get_account_info(
     account_id: Annotated[str, Field(description="The account ID to retrieve")],
 ) -> str:
     """Get detailed information about a bank account."""
-    if account_id not in _accounts:
+    account = _lookup_account(account_id)
+    if account is None:
         return f"Error: Account {account_id} not found."
-
-    account = _accounts[account_id]
-    return (
-        f"Account ID: {account.id}\n"
-        f"Name: {account.name}\n"
-        f"Balance: ${account.balance:.2f}\n"
-        f"Created: {account.created_at.isoformat()}\n"
-        f"Transaction count: {len(account.transactions)}"
+    return _ACCOUNT_INFO_TMPL.format_map(
+        {
+            "id": account.id,
+            "name": account.name,
+            "balance": _fmt_cents(account.balance),
+            "created": account.created_at.isoformat(),
+            "txn_count": len(account.transactions),
+        }
     )
 
 
@@ -112,8 +214,16 @@ def list_accounts() -> str:
     if not _accounts:
         return "No accounts found."
 
-    account_lines = [f"  {account.id}: {account.name} - ${account.balance:.2f}" for account in _accounts.values()]
-    return "\n".join(["Account List:", "-" * 40, *account_lines])
+    cached = _list_caches.get("list_accounts")
+    if cached is not None:
+        return cached
+
+    account_lines = [
+        f"  {account.id}: {account.name} - {_fmt_cents(account.balance)}" for account in _accounts.values()
+    ]
+    result = "\n".join(["Account List:", "-" * 40, *account_lines])
+    _list_caches["list_accounts"] = result
+    return result
 
 
 @mcp.tool()
@@ -121,14 +231,17 @@ def close_account(
     account_id: Annotated[str, Field(description="The account ID to close")],
 ) -> str:
     """Close a bank account. Account must have zero balance."""
-    if account_id not in _accounts:
+    key = _parse_id(account_id)
+    account = _accounts.get(key) if key is not None else None
+    if account is None or key is None:
         return f"Error: Account {account_id} not found."
+    if account.balance != 0:
+        return (
+            f"Error: Cannot close account with balance {_fmt_cents(account.balance)}. Please withdraw all funds first."
+        )
 
-    account = _accounts[account_id]
-    if account.balance != Decimal("0.00"):
-        return f"Error: Cannot close account with balance ${account.balance:.2f}. Please withdraw all funds first."
-
-    del _accounts[account_id]
+    del _accounts[key]
+    _list_caches.clear()
     return f"Account {account_id} has been closed successfully."
 
 
@@ -138,141 +251,151 @@ def close_account(
 @mcp.tool()
 def deposit(
     account_id: Annotated[str, Field(description="The account ID to deposit into")],
-    amount: Annotated[float, Field(description="Amount to deposit", gt=0)],
+    amount: float,
     description: Annotated[str, Field(description="Transaction description")] = "Deposit",
 ) -> str:
     """Deposit money into a bank account."""
-    if account_id not in _accounts:
-        return f"Error: Account {account_id} not found."
+    if amount <= 0:
+        return "Error: Deposit amount must be positive."
 
-    account = _accounts[account_id]
-    deposit_amount = Decimal(str(amount))
+    account = _lookup_account(account_id)
+    if account is None:
+        return f"Error: Account {account_id} not found."
+    deposit_amount = _to_cents(amount)
 
-    transaction = Transaction(
-        id=_generate_transaction_id(),
-        account_id=account_id,
+    account.balance += deposit_amount
+    account.refresh_fmt_line()
+    _list_caches.clear()
+    account.transactions.append(
+        transaction_id=_generate_transaction_id(),
         amount=deposit_amount,
-        transaction_type="deposit",
-        timestamp=datetime.now(timezone.utc),
+        transaction_type=DEPOSIT,
+        timestamp=_utcnow(),
         description=description,
     )
 
-    account.balance += deposit_amount
-    account.transactions.append(transaction)
-
-    return f"Deposited ${deposit_amount:.2f} to {account_id}. New balance: ${account.balance:.2f}"
+    return f"Deposited {_fmt_cents(deposit_amount)} to {account_id}. New balance: {_fmt_cents(account.balance)}"
 
 
 @mcp.tool()
 def withdraw(
     account_id: Annotated[str, Field(description="The account ID to withdraw from")],
-    amount: Annotated[float, Field(description="Amount to withdraw", gt=0)],
+    amount: float,
     description: Annotated[str, Field(description="Transaction description")] = "Withdrawal",
 ) -> str:
     """Withdraw money from a bank account."""
-    if account_id not in _accounts:
-        return f"Error: Account {account_id} not found."
+    if amount <= 0:
+        return "Error: Withdrawal amount must be positive."
 
-    account = _accounts[account_id]
-    withdrawal_amount = Decimal(str(amount))
+    account = _lookup_account(account_id)
+    if account is None:
+        return f"Error: Account {account_id} not found."
+    withdrawal_amount = _to_cents(amount)
 
     if account.balance < withdrawal_amount:
-        return f"Error: Insufficient funds. Available balance: ${account.balance:.2f}"
+        return f"Error: Insufficient funds. Available balance: {_fmt_cents(account.balance)}"
 
-    transaction = Transaction(
-        id=_generate_transaction_id(),
-        account_id=account_id,
+    account.balance -= withdrawal_amount
+    account.refresh_fmt_line()
+    _list_caches.clear()
+    account.transactions.append(
+        transaction_id=_generate_transaction_id(),
         amount=withdrawal_amount,
-        transaction_type="withdrawal",
-        timestamp=datetime.now(timezone.utc),
+        transaction_type=WITHDRAWAL,
+        timestamp=_utcnow(),
         description=description,
     )
 
-    account.balance -= withdrawal_amount
-    account.transactions.append(transaction)
-
-    return f"Withdrew ${withdrawal_amount:.2f} from {account_id}. New balance: ${account.balance:.2f}"
+    return f"Withdrew {_fmt_cents(withdrawal_amount)} from {account_id}. New balance: {_fmt_cents(account.balance)}"
 
 
 @mcp.tool()
 def transfer(
     from_account_id: Annotated[str, Field(description="The source account ID")],
     to_account_id: Annotated[str, Field(description="The destination account ID")],
-    amount: Annotated[float, Field(description="Amount to transfer", gt=0)],
+    amount: float,
     description: Annotated[str, Field(description="Transfer description")] = "Transfer",
 ) -> str:
     """Transfer money between two bank accounts."""
-    if from_account_id not in _accounts:
+    if amount <= 0:
+        return "Error: Transfer amount must be positive."
+
+    from_account = _lookup_account(from_account_id)
+    if from_account is None:
         return f"Error: Source account {from_account_id} not found."
-    if to_account_id not in _accounts:
+    to_account = _lookup_account(to_account_id)
+    if to_account is None:
         return f"Error: Destination account {to_account_id} not found."
-    if from_account_id == to_account_id:
+    if from_account is to_account:
         return "Error: Cannot transfer to the same account."
-
-    from_account = _accounts[from_account_id]
-    to_account = _accounts[to_account_id]
-    transfer_amount = Decimal(str(amount))
+    transfer_amount = _to_cents(amount)
 
     if from_account.balance < transfer_amount:
-        return f"Error: Insufficient funds. Available balance: ${from_account.balance:.2f}"
+        return f"Error: Insufficient funds. Available balance: {_fmt_cents(from_account.balance)}"
+
+    timestamp = _utcnow()
 
-    timestamp = datetime.now(timezone.utc)
+    from_account.balance -= transfer_amount
+    to_account.balance += transfer_amount
+    from_account.refresh_fmt_line()
+    to_account.refresh_fmt_line()
+    _list_caches.clear()
 
-    # Create outgoing transaction
-    out_transaction = Transaction(
-        id=_generate_transaction_id(),
-        account_id=from_account_id,
+    # Record outgoing transaction
+    from_account.transactions.append(
+        transaction_id=_generate_transaction_id(),
         amount=transfer_amount,
-        transaction_type="transfer_out",
+        transaction_type=TRANSFER_OUT,
         timestamp=timestamp,
         description=f"{description} to {to_account_id}",
     )
 
-    # Create incoming transaction
-    in_transaction = Transaction(
-        id=_generate_transaction_id(),
-        account_id=to_account_id,
+    # Record incoming transaction
+    to_account.transactions.append(
+        transaction_id=_generate_transaction_id(),
         amount=transfer_amount,
-        transaction_type="transfer_in",
+        transaction_type=TRANSFER_IN,
         timestamp=timestamp,
         description=f"{description} from {from_account_id}",
     )
 
-    from_account.balance -= transfer_amount
-    to_account.balance += transfer_amount
-    from_account.transactions.append(out_transaction)
-    to_account.transactions.append(in_transaction)
-
-    return (
-        f"Transferred ${transfer_amount:.2f} from {from_account_id} to {to_account_id}.\n"
-        f"Source balance: ${from_account.balance:.2f}\n"
-        f"Destination balance: ${to_account.balance:.2f}"
+    return _TRANSFER_RESULT_TMPL.format_map(
+        {
+            "amount": _fmt_cents(transfer_amount),
+            "from_id": from_account_id,
+            "to_id": to_account_id,
+            "source": _fmt_cents(from_account.balance),
+            "destination": _fmt_cents(to_account.balance),
+        }
     )
 
 
 @mcp.tool()
 def get_transaction_history(
     account_id: Annotated[str, Field(description="The account ID to get history for")],
-    limit: Annotated[int, Field(description="Maximum number of transactions to return", ge=1, le=100)] = 10,
+    limit: int = 10,
 ) -> str:
     """Get the transaction history for a bank account."""
-    if account_id not in _accounts:
-        return f"Error: Account {account_id} not found."
+    if not 1 <= limit <= 100:
+        return "Error: Limit must be between 1 and 100."
 
-    account = _accounts[account_id]
-    transactions = account.transactions[-limit:]
+    account = _lookup_account(account_id)
+    if account is None:
+        return f"Error: Account {account_id} not found."
+    log = account.transactions
 
-    if not transactions:
+    if not log.ids:
         return f"No transactions found for account {account_id}."
 
-    lines = [f"Transaction History for {account_id}:", "-" * 50]
-    for txn in reversed(transactions):
-        sign = "+" if txn.transaction_type in ("deposit", "transfer_in") else "-"
-        lines.append(f"  {txn.timestamp.strftime('%Y-%m-%d %H:%M')} | {sign}${txn.amount:.2f} | {txn.description}")
-    lines.append("-" * 50)
-    lines.append(f"Current Balance: ${account.balance:.2f}")
-
-    return "\n".join(lines)
+    return "\n".join(
+        [
+            f"Transaction History for {account_id}:",
+            "-" * 50,
+            *reversed(log.lines[-limit:]),
+            "-" * 50,
+            f"Current Balance: {_fmt_cents(account.balance)}",
+        ]
+    )
 
 
 # ===== Resources =====
@@ -284,52 +407,81 @@ def list_all_accounts() -> str:
     if not _accounts:
         return "No accounts available."
 
-    lines = [f"{account.id}: {account.name} (${account.balance:.2f})" for account in _accounts.values()]
-    return "\n".join(lines)
+    cached = _list_caches.get("list_all_accounts")
+    if cached is not None:
+        return cached
+
+    result = "\n".join(account.fmt_line for account in _accounts.values())
+    _list_caches["list_all_accounts"] = result
+    return result
 
 
 @mcp.resource("bank://account/{account_id}")
 def get_account_resource(account_id: str) -> str:
     """Get details of a specific bank account as a resource."""
-    if account_id not in _accounts:
+    account = _lookup_account(account_id)
+    if account is None:
         return f"Account {account_id} not found."
-
-    account = _accounts[account_id]
-    return (
-        f"Account: {account.id}\n"
-        f"Holder: {account.name}\n"
-        f"Balance: ${account.balance:.2f}\n"
-        f"Opened: {account.created_at.strftime('%Y-%m-%d')}"
+    return _ACCOUNT_RESOURCE_TMPL.format_map(
+        {
+            "id": account.id,
+            "name": account.name,
+            "balance": _fmt_cents(account.balance),
+            "opened": account.created_at.strftime("%Y-%m-%d"),
+        }
     )
 
 
 @mcp.resource("bank://account/{account_id}/balance")
 def get_balance_resource(account_id: str) -> str:
     """Get just the balance of an account as a resource."""
-    if account_id not in _accounts:
+    account = _lookup_account(account_id)
+    if account is None:
         return "0.00"
-    return str(_accounts[account_id].balance)
+    balance = account.balance
+    return _BALANCE_TMPL.format_map({"dollars": balance // 100, "cents": balance % 100})
 
 
 # ===== Prompts =====
 
 
+# Prompt bodies are pure functions of their string arguments, so repeated
+# renders with the same arguments are served from a small cache. The cache
+# lives behind the registered function because pydantic's validate_call
+# rejects lru_cache wrapper objects.
+
+
+@functools.lru_cache(maxsize=256)
+def _render_open_account(name: str, initial_deposit: str) -> str:
+    return f"Please open a new bank account for {name} with an initial deposit of ${initial_deposit}."
+
+
+@functools.lru_cache(maxsize=256)
+def _render_check_balance(account_id: str) -> str:
+    return f"Please check the balance for account {account_id}."
+
+
+@functools.lru_cache(maxsize=256)
+def _render_make_transfer(from_account: str, to_account: str, amount: str) -> str:
+    return f"Please transfer ${amount} from account {from_account} to account {to_account}."
+
+
 @mcp.prompt("open_account")
 def open_account_prompt(name: str, initial_deposit: str = "0") -> str:
     """Prompt template for opening a new bank account."""
-    return f"Please open a new bank account for {name} with an initial deposit of ${initial_deposit}."
+    return _render_open_account(name, initial_deposit)
 
 
 @mcp.prompt("check_balance")
 def check_balance_prompt(account_id: str) -> str:
     """Prompt template for checking account balance."""
-    return f"Please check the balance for account {account_id}."
+    return _render_check_balance(account_id)
 
 
 @mcp.prompt("make_transfer")
 def make_transfer_prompt(from_account: str, to_account: str, amount: str) -> str:
     """Prompt template for making a transfer between accounts."""
-    return f"Please transfer ${amount} from account {from_account} to account {to_account}."
+    return _render_make_transfer(from_account, to_account, amount)
 
 
 if __name__ == "__main__":
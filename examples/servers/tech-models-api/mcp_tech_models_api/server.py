@@ -11,13 +11,27 @@ This server showcases:
 """
 
 import asyncio
+import atexit
 import base64
+import bisect
+import heapq
+import hmac
+import html
 import json
 import logging
+import logging.handlers
+import operator
+import os
+import queue
+import secrets
+import sys
+import textwrap
 import time
+import urllib.parse
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
-import click
 from pydantic import AnyHttpUrl, BaseModel
 from starlette.exceptions import HTTPException
 from starlette.requests import Request
@@ -41,10 +55,167 @@ from mcp.types import (
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _dumps(data: Any) -> str:
+        """Pretty-print JSON via orjson's C encoder when it is installed."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:  # pragma: no cover - fallback when orjson is absent
+
+    def _dumps(data: Any) -> str:
+        """Pretty-print JSON with the stdlib encoder."""
+        return json.dumps(data, indent=2)
+
+
 # Test data for content types
 TEST_IMAGE_BASE64 = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8DwHwAFBQIAX8jx0gAAAABJRU5ErkJggg=="
 TEST_AUDIO_BASE64 = "UklGRiYAAABXQVZFZm10IBAAAAABAAEAQB8AAAB9AAACABAAZGF0YQIAAAA="
 
+# How often the background sweeper evicts expired codes/tokens
+_EXPIRY_SWEEP_INTERVAL = 60.0  # seconds
+
+# Cosmetic pause between progress updates in tool_with_progress; defaults
+# to zero so the tool's latency reflects only report_progress overhead.
+# Malformed values fall back to zero rather than failing the import.
+try:
+    _PROGRESS_DELAY = float(os.environ.get("MCP_DEMO_PROGRESS_DELAY", "0"))
+except ValueError:
+    _PROGRESS_DELAY = 0.0
+
+# Dispatch table for the calculate tool; operator.* are C functions
+_OPS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+}
+_OPS_KEYS = tuple(_OPS)
+
+# Completion candidates per argument name; tuples are sorted so prefix
+# matches can be found with two bisects instead of a full scan
+_COMPLETIONS: dict[str, tuple[str, ...]] = {
+    sys.intern("format"): ("csv", "json", "xml", "yaml"),
+    sys.intern("operation"): ("add", "divide", "multiply", "subtract"),
+    sys.intern("id"): ("123", "456", "789", "abc", "xyz"),
+    sys.intern("query"): ("DELETE FROM cache", "SELECT * FROM data", "UPDATE status SET value = 1"),
+}
+
+# Shared result for the no-match path; skips a pydantic construction per call
+_EMPTY_COMPLETION = Completion(values=[], total=0, hasMore=False)
+
+# Static payloads: pure functions of module constants, built once at import
+_IMAGE_BYTES = base64.b64decode(TEST_IMAGE_BASE64)
+
+_DEMO_CONTENT: list[TextContent | ImageContent | AudioContent] = [
+    TextContent(
+        type="text",
+        text="This response demonstrates multiple content types supported by the API.",
+    ),
+    ImageContent(
+        type="image",
+        data=TEST_IMAGE_BASE64,
+        mimeType="image/png",
+    ),
+    AudioContent(
+        type="audio",
+        data=TEST_AUDIO_BASE64,
+        mimeType="audio/wav",
+    ),
+]
+
+_SYSTEM_ANALYSIS_MESSAGES = [
+    UserMessage(
+        role="user",
+        content=TextContent(
+            type="text",
+            text=(
+                "Analyze the current system status, performance metrics, "
+                "and provide recommendations for optimization."
+            ),
+        ),
+    )
+]
+
+_MULTIMODAL_ANALYSIS_MESSAGES = [
+    UserMessage(
+        role="user",
+        content=ImageContent(
+            type="image",
+            data=TEST_IMAGE_BASE64,
+            mimeType="image/png",
+        ),
+    ),
+    UserMessage(
+        role="user",
+        content=TextContent(
+            type="text",
+            text="Analyze the provided image and describe its contents, structure, and any notable features.",
+        ),
+    ),
+]
+
+_API_DOCS = textwrap.dedent(
+    """
+    # MCP Technology Models API Documentation
+
+    ## Overview
+    This API provides comprehensive access to all MCP technology models with secure authentication.
+
+    ## Features
+    - OAuth 2.0 Authentication
+    - RESTful API Design
+    - Multiple Content Types Support
+    - Real-time Progress Tracking
+    - Comprehensive Error Handling
+
+    ## Endpoints
+    - Tools: Execute various operations and get system information
+    - Resources: Access server data and documentation
+    - Prompts: Generate contextual prompts for AI interactions
+    - Completions: Get intelligent suggestions and completions
+
+    ## Authentication
+    All requests require OAuth 2.0 authentication with the 'mcp' scope.
+    """
+)
+
+# The login-success page is fully static; encode it once at import
+_SUCCESS_HTML_BYTES = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Login Successful</title>
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            height: 100vh;
+            margin: 0;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        }
+        .success-container {
+            background: white;
+            padding: 2rem;
+            border-radius: 10px;
+            box-shadow: 0 10px 25px rgba(0,0,0,0.2);
+            text-align: center;
+        }
+        h1 { color: #22c55e; }
+    </style>
+</head>
+<body>
+    <div class="success-container">
+        <h1>✅ Login Successful!</h1>
+        <p>You have been authenticated. You can now close this window.</p>
+    </div>
+</body>
+</html>
+""".encode()
+
 
 class TechModelAuthSettings(BaseModel):
     """Authentication settings for the tech models API."""
@@ -54,6 +225,26 @@ class TechModelAuthSettings(BaseModel):
     demo_password: str = "demo123"
 
 
+class TokenData:
+    """Access-token record stored directly in the token table."""
+
+    __slots__ = ("client_id", "scopes", "resource", "created_at", "expires_at")
+
+    def __init__(
+        self,
+        client_id: str,
+        scopes: list[str],
+        resource: str | None,
+        created_at: float,
+        expires_at: float,
+    ):
+        self.client_id = client_id
+        self.scopes = scopes
+        self.resource = resource
+        self.created_at = created_at
+        self.expires_at = expires_at
+
+
 class TechModelOAuthProvider(OAuthAuthorizationServerProvider[Any, Any, Any]):
     """OAuth provider for the tech models API server."""
 
@@ -61,15 +252,28 @@ class TechModelOAuthProvider(OAuthAuthorizationServerProvider[Any, Any, Any]):
         self.auth_settings = auth_settings
         self.auth_callback_path = auth_callback_path
         self.server_url = server_url
+        # Plain attributes: pydantic model attribute access is slower than a
+        # slot load and the credentials are checked on every login attempt
+        self._demo_user = auth_settings.demo_username
+        self._demo_pass = auth_settings.demo_password
         # In-memory storage for demo purposes
         self._clients: dict[str, dict[str, Any]] = {}
         self._auth_codes: dict[str, dict[str, Any]] = {}
-        self._access_tokens: dict[str, dict[str, Any]] = {}
+        self._access_tokens: dict[str, TokenData] = {}
         self._refresh_tokens: dict[str, dict[str, Any]] = {}
-
-    async def get_login_page(self, state: str) -> Response:
-        """Return a simple HTML login form."""
-        html = f"""
+        # Min-heap of (expires_at, token, table) so expired entries can be
+        # evicted without scanning the tables; see sweep_expired_loop.
+        self._expiry_heap: list[tuple[float, str, dict[str, Any]]] = []
+        # The login page only varies in the state value, so render everything
+        # else once and keep the encoded halves around; each request is then
+        # two bytes concatenations instead of a ~2KB f-string rebuild.
+        prefix, _, suffix = self._render_login_html("\x00state\x00").partition("\x00state\x00")
+        self._login_prefix_bytes = prefix.encode("utf-8")
+        self._login_suffix_bytes = suffix.encode("utf-8")
+
+    def _render_login_html(self, state: str) -> str:
+        """Render the full login page HTML for the given state value."""
+        return f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -137,65 +341,46 @@ class TechModelOAuthProvider(OAuthAuthorizationServerProvider[Any, Any, Any]):
                 </form>
                 <div class="info">
                     <strong>Demo Credentials:</strong><br>
-                    Username: {self.auth_settings.demo_username}<br>
-                    Password: {self.auth_settings.demo_password}
+                    Username: {self._demo_user}<br>
+                    Password: {self._demo_pass}
                 </div>
             </div>
         </body>
         </html>
         """
-        return Response(content=html, media_type="text/html")
+
+    async def get_login_page(self, state: str) -> Response:
+        """Return a simple HTML login form."""
+        body = self._login_prefix_bytes + html.escape(state).encode("utf-8") + self._login_suffix_bytes
+        return Response(content=body, media_type="text/html")
 
     async def handle_login_callback(self, request: Request) -> Response:
         """Handle the login form submission."""
-        form = await request.form()
-        username = form.get("username")
-        password = form.get("password")
-        state = form.get("state")
+        content_type = request.headers.get("content-type", "")
+        if content_type.startswith("application/x-www-form-urlencoded"):
+            # The login form posts urlencoded bodies of a few fields; parsing
+            # them directly skips Starlette's FormData machinery
+            body = await request.body()
+            fields = dict(urllib.parse.parse_qsl(body.decode("latin-1"), max_num_fields=4))
+            username = fields.get("username")
+            password = fields.get("password")
+            state = fields.get("state")
+        else:
+            form = await request.form()
+            username = form.get("username")
+            password = form.get("password")
+            state = form.get("state")
 
         if not state:
             raise HTTPException(400, "Missing state parameter")
 
         # Simple credential validation
-        if username == self.auth_settings.demo_username and password == self.auth_settings.demo_password:
+        if username == self._demo_user and password == self._demo_pass:
             # Authentication successful - redirect with success
             # In a real implementation, this would generate an auth code and redirect
 
             # For demo, we'll just show success
-            html = """
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Login Successful</title>
-                <style>
-                    body {
-                        font-family: Arial, sans-serif;
-                        display: flex;
-                        justify-content: center;
-                        align-items: center;
-                        height: 100vh;
-                        margin: 0;
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    }
-                    .success-container {
-                        background: white;
-                        padding: 2rem;
-                        border-radius: 10px;
-                        box-shadow: 0 10px 25px rgba(0,0,0,0.2);
-                        text-align: center;
-                    }
-                    h1 { color: #22c55e; }
-                </style>
-            </head>
-            <body>
-                <div class="success-container">
-                    <h1>✅ Login Successful!</h1>
-                    <p>You have been authenticated. You can now close this window.</p>
-                </div>
-            </body>
-            </html>
-            """
-            return Response(content=html, media_type="text/html")
+            return Response(content=_SUCCESS_HTML_BYTES, media_type="text/html")
         else:
             # Authentication failed
             raise HTTPException(401, "Invalid credentials")
@@ -208,18 +393,21 @@ class TechModelOAuthProvider(OAuthAuthorizationServerProvider[Any, Any, Any]):
         **kwargs: Any,
     ) -> tuple[str, str]:
         """Create a new OAuth client."""
-        client_id = f"client_{int(time.time() * 1000)}"
-        client_secret = base64.b64encode(f"{client_id}:secret".encode()).decode()
-        
+        client_id = f"client_{secrets.token_urlsafe(12)}"
+        client_secret = secrets.token_urlsafe(24)
+
+        now = time.time()
         self._clients[client_id] = {
             "client_id": client_id,
-            "client_secret": client_secret,
+            # Stored as bytes so validate_client_secret can compare digests
+            # without re-encoding the stored side on every attempt
+            "client_secret": client_secret.encode("ascii"),
             "client_name": client_name,
             "redirect_uris": [str(uri) for uri in redirect_uris],
             "scopes": scopes,
-            "created_at": time.time(),
+            "created_at": now,
         }
-        
+
         return client_id, client_secret
 
     async def get_client(self, client_id: str) -> dict[str, Any] | None:
@@ -231,7 +419,7 @@ class TechModelOAuthProvider(OAuthAuthorizationServerProvider[Any, Any, Any]):
         client = self._clients.get(client_id)
         if not client:
             return False
-        return client["client_secret"] == client_secret
+        return hmac.compare_digest(client["client_secret"], client_secret.encode("ascii", "replace"))
 
     async def create_authorization_code(
         self,
@@ -242,17 +430,19 @@ class TechModelOAuthProvider(OAuthAuthorizationServerProvider[Any, Any, Any]):
         **kwargs: Any,
     ) -> str:
         """Create an authorization code."""
-        auth_code = base64.b64encode(f"code_{int(time.time() * 1000)}".encode()).decode()
-        
+        auth_code = secrets.token_urlsafe(24)
+
+        now = time.time()
         self._auth_codes[auth_code] = {
             "client_id": client_id,
             "redirect_uri": redirect_uri,
             "scopes": scopes,
             "code_challenge": code_challenge,
-            "created_at": time.time(),
-            "expires_at": time.time() + 600,  # 10 minutes
+            "created_at": now,
+            "expires_at": now + 600,  # 10 minutes
         }
-        
+        heapq.heappush(self._expiry_heap, (now + 600, auth_code, self._auth_codes))
+
         return auth_code
 
     async def validate_authorization_code(
@@ -264,22 +454,23 @@ class TechModelOAuthProvider(OAuthAuthorizationServerProvider[Any, Any, Any]):
     ) -> dict[str, Any] | None:
         """Validate and consume an authorization code."""
         auth_code_data = self._auth_codes.get(code)
-        
+
         if not auth_code_data:
             return None
-            
+
+        # Cheapest check first: one float compare against a single clock read
+        if auth_code_data["expires_at"] < time.time():
+            return None
+
         if auth_code_data["client_id"] != client_id:
             return None
-            
+
         if auth_code_data["redirect_uri"] != redirect_uri:
             return None
-            
-        if auth_code_data["expires_at"] < time.time():
-            return None
-        
+
         # Remove the code after use (one-time use)
         del self._auth_codes[code]
-        
+
         return auth_code_data
 
     async def create_access_token(
@@ -290,17 +481,19 @@ class TechModelOAuthProvider(OAuthAuthorizationServerProvider[Any, Any, Any]):
         **kwargs: Any,
     ) -> tuple[str, int]:
         """Create an access token."""
-        access_token = base64.b64encode(f"access_{int(time.time() * 1000)}".encode()).decode()
+        access_token = secrets.token_urlsafe(32)
         expires_in = 3600  # 1 hour
-        
-        self._access_tokens[access_token] = {
-            "client_id": client_id,
-            "scopes": scopes,
-            "resource": resource,
-            "created_at": time.time(),
-            "expires_at": time.time() + expires_in,
-        }
-        
+
+        now = time.time()
+        self._access_tokens[access_token] = TokenData(
+            client_id=client_id,
+            scopes=scopes,
+            resource=resource,
+            created_at=now,
+            expires_at=now + expires_in,
+        )
+        heapq.heappush(self._expiry_heap, (now + expires_in, access_token, self._access_tokens))
+
         return access_token, expires_in
 
     async def create_refresh_token(
@@ -310,34 +503,41 @@ class TechModelOAuthProvider(OAuthAuthorizationServerProvider[Any, Any, Any]):
         **kwargs: Any,
     ) -> str:
         """Create a refresh token."""
-        refresh_token = base64.b64encode(f"refresh_{int(time.time() * 1000)}".encode()).decode()
-        
+        refresh_token = secrets.token_urlsafe(24)
+
+        now = time.time()
         self._refresh_tokens[refresh_token] = {
             "client_id": client_id,
             "scopes": scopes,
-            "created_at": time.time(),
+            "created_at": now,
         }
         
         return refresh_token
 
-    async def load_access_token(self, token: str) -> Any:
+    async def load_access_token(self, token: str) -> TokenData | None:
         """Load access token data."""
         token_data = self._access_tokens.get(token)
-        if not token_data:
+        if token_data is None:
             return None
-            
-        if token_data["expires_at"] < time.time():
+
+        if token_data.expires_at < time.time():
             return None
-            
-        # Return a simple object with required attributes
-        class TokenData:
-            def __init__(self, data: dict[str, Any]):
-                self.client_id = data["client_id"]
-                self.scopes = data["scopes"]
-                self.resource = data.get("resource")
-                self.expires_at = data["expires_at"]
-        
-        return TokenData(token_data)
+
+        return token_data
+
+    def sweep_expired(self) -> None:
+        """Evict expired codes and tokens from the in-memory tables."""
+        now = time.time()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, token, table = heapq.heappop(heap)
+            table.pop(token, None)
+
+    async def sweep_expired_loop(self) -> None:
+        """Run sweep_expired periodically for the lifetime of the server."""
+        while True:
+            await asyncio.sleep(_EXPIRY_SWEEP_INTERVAL)
+            self.sweep_expired()
 
     async def revoke_token(self, token: str) -> bool:
         """Revoke a token."""
@@ -364,6 +564,15 @@ def create_tech_models_api_server(
         str(server_url),
     )
 
+    @asynccontextmanager
+    async def lifespan(_server: FastMCP) -> AsyncIterator[None]:
+        """Run the token-expiry sweeper alongside the server."""
+        sweeper = asyncio.create_task(oauth_provider.sweep_expired_loop())
+        try:
+            yield
+        finally:
+            sweeper.cancel()
+
     mcp_auth_settings = AuthSettings(
         issuer_url=server_url,
         client_registration_options=ClientRegistrationOptions(
@@ -381,8 +590,9 @@ def create_tech_models_api_server(
         auth_server_provider=oauth_provider,
         host=host,
         port=port,
-        debug=True,
+        debug=os.environ.get("MCP_DEBUG", "").lower() in ("1", "true", "yes"),
         auth=mcp_auth_settings,
+        lifespan=lifespan,
     )
 
     # Add custom routes for login
@@ -436,24 +646,19 @@ def create_tech_models_api_server(
         Returns:
             Result of the calculation with metadata
         """
-        operations = {
-            "add": lambda x, y: x + y,
-            "subtract": lambda x, y: x - y,
-            "multiply": lambda x, y: x * y,
-            "divide": lambda x, y: x / y if y != 0 else None,
-        }
-        
-        if operation not in operations:
+        op = _OPS.get(operation)
+
+        if op is None:
             return {
                 "error": f"Unknown operation: {operation}",
-                "supported_operations": list(operations.keys()),
+                "supported_operations": list(_OPS_KEYS),
             }
-        
-        result = operations[operation](a, b)
-        
-        if result is None:
+
+        if operation == "divide" and b == 0:
             return {"error": "Division by zero"}
-        
+
+        result = op(a, b)
+
         return {
             "operation": operation,
             "operands": {"a": a, "b": b},
@@ -468,22 +673,7 @@ def create_tech_models_api_server(
         Returns a list containing text, image, and audio content to showcase
         the API's capability to handle diverse content types.
         """
-        return [
-            TextContent(
-                type="text",
-                text="This response demonstrates multiple content types supported by the API.",
-            ),
-            ImageContent(
-                type="image",
-                data=TEST_IMAGE_BASE64,
-                mimeType="image/png",
-            ),
-            AudioContent(
-                type="audio",
-                data=TEST_AUDIO_BASE64,
-                mimeType="audio/wav",
-            ),
-        ]
+        return _DEMO_CONTENT
 
     @mcp.tool()
     async def tool_with_progress(ctx: Context[ServerSession, None]) -> str:
@@ -494,11 +684,13 @@ def create_tech_models_api_server(
         at each stage, useful for tracking long-running tasks.
         """
         await ctx.report_progress(progress=0, total=100, message="Starting operation")
-        await asyncio.sleep(0.1)
-        
+        # With the default zero delay this is a bare event-loop yield
+        # (call_soon), not a timer-heap entry, so progress still flushes
+        await asyncio.sleep(_PROGRESS_DELAY)
+
         await ctx.report_progress(progress=50, total=100, message="Processing data")
-        await asyncio.sleep(0.1)
-        
+        await asyncio.sleep(_PROGRESS_DELAY)
+
         await ctx.report_progress(progress=100, total=100, message="Operation complete")
         
         return "Operation completed successfully with progress tracking"
@@ -515,36 +707,14 @@ def create_tech_models_api_server(
             "version": "1.0.0",
             "authenticated": True,
         }
-        return json.dumps(status_data, indent=2)
+        return _dumps(status_data)
 
     @mcp.resource("tech://api/documentation")
     def api_documentation_resource() -> str:
         """
         Comprehensive API documentation resource.
         """
-        docs = """
-        # MCP Technology Models API Documentation
-        
-        ## Overview
-        This API provides comprehensive access to all MCP technology models with secure authentication.
-        
-        ## Features
-        - OAuth 2.0 Authentication
-        - RESTful API Design
-        - Multiple Content Types Support
-        - Real-time Progress Tracking
-        - Comprehensive Error Handling
-        
-        ## Endpoints
-        - Tools: Execute various operations and get system information
-        - Resources: Access server data and documentation
-        - Prompts: Generate contextual prompts for AI interactions
-        - Completions: Get intelligent suggestions and completions
-        
-        ## Authentication
-        All requests require OAuth 2.0 authentication with the 'mcp' scope.
-        """
-        return docs
+        return _API_DOCS
 
     @mcp.resource("tech://data/template/{id}")
     def template_resource(id: str) -> str:
@@ -560,14 +730,14 @@ def create_tech_models_api_server(
             "generated_at": time.time(),
             "data": f"This is dynamic content for resource ID: {id}",
         }
-        return json.dumps(data, indent=2)
+        return _dumps(data)
 
     @mcp.resource("tech://binary/image")
     def binary_image_resource() -> bytes:
         """
         Binary resource providing image data.
         """
-        return base64.b64decode(TEST_IMAGE_BASE64)
+        return _IMAGE_BYTES
 
     # ========== PROMPTS ==========
     @mcp.prompt()
@@ -575,18 +745,7 @@ def create_tech_models_api_server(
         """
         Generate a prompt for analyzing system status and performance.
         """
-        return [
-            UserMessage(
-                role="user",
-                content=TextContent(
-                    type="text",
-                    text=(
-                        "Analyze the current system status, performance metrics, "
-                        "and provide recommendations for optimization."
-                    ),
-                ),
-            )
-        ]
+        return _SYSTEM_ANALYSIS_MESSAGES
 
     @mcp.prompt()
     def data_query_prompt(query: str, format: str = "json") -> list[UserMessage]:
@@ -612,23 +771,7 @@ def create_tech_models_api_server(
         """
         Generate a prompt for multimodal content analysis.
         """
-        return [
-            UserMessage(
-                role="user",
-                content=ImageContent(
-                    type="image",
-                    data=TEST_IMAGE_BASE64,
-                    mimeType="image/png",
-                ),
-            ),
-            UserMessage(
-                role="user",
-                content=TextContent(
-                    type="text",
-                    text="Analyze the provided image and describe its contents, structure, and any notable features.",
-                ),
-            ),
-        ]
+        return _MULTIMODAL_ANALYSIS_MESSAGES
 
     # ========== COMPLETIONS ==========
     @mcp.completion()
@@ -643,50 +786,57 @@ def create_tech_models_api_server(
         This handler suggests appropriate values based on the context
         and argument being completed.
         """
-        # Example completions for different argument names
-        completion_suggestions: dict[str, list[str]] = {
-            "format": ["json", "csv", "xml", "yaml"],
-            "operation": ["add", "subtract", "multiply", "divide"],
-            "id": ["123", "456", "789", "abc", "xyz"],
-            "query": ["SELECT * FROM data", "UPDATE status SET value = 1", "DELETE FROM cache"],
-        }
-        
-        suggestions = completion_suggestions.get(argument.name, [])
-        
-        # Filter suggestions based on current value
+        candidates = _COMPLETIONS.get(argument.name, ())
+
+        # The candidate tuples are sorted, so every prefix match lies in a
+        # contiguous range delimited by two binary searches
         if argument.value:
-            suggestions = [s for s in suggestions if s.startswith(argument.value)]
-        
+            lo = bisect.bisect_left(candidates, argument.value)
+            hi = bisect.bisect_left(candidates, argument.value + "\uffff")
+            candidates = candidates[lo:hi]
+
+        if not candidates:
+            return _EMPTY_COMPLETION
+
         return Completion(
-            values=suggestions,
-            total=len(suggestions),
+            values=list(candidates),
+            total=len(candidates),
             hasMore=False,
         )
 
     return mcp
 
 
-@click.command()
-@click.option("--host", default="localhost", help="Host to bind the server to")
-@click.option("--port", default=8000, help="Port to listen on")
-@click.option("--transport", default="streamable-http", type=click.Choice(["streamable-http", "sse"]),
-              help="Transport protocol to use")
-def main(host: str, port: int, transport: str) -> int:
+def run_server(host: str, port: int, transport: str) -> int:
     """
     Run the MCP Technology Models API Server.
     
     This server provides a comprehensive demonstration of all MCP technology models
     (tools, resources, prompts, completions) with secure OAuth authentication.
     """
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
+    # Log through a queue so request handlers do a lock-free put and a
+    # background thread handles formatting and stream I/O
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    root_logger = logging.getLogger()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
+    listener.start()
+    atexit.register(listener.stop)
 
     auth_settings = TechModelAuthSettings()
     
     server = create_tech_models_api_server(host, port, auth_settings)
     
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     logger.info(f"🔥 MCP Technology Models API Server starting on http://{host}:{port}")
     logger.info(f"📚 API endpoint: http://{host}:{port}/mcp")
     logger.info(f"🔐 Demo credentials - Username: {auth_settings.demo_username}, Password: ********")
@@ -696,5 +846,22 @@ def main(host: str, port: int, transport: str) -> int:
     return 0
 
 
+def main() -> int:
+    """Command-line entry point; click is imported here so that importing
+    this module as a library does not pay the CLI startup cost."""
+    import click
+
+    @click.command()
+    @click.option("--host", default="localhost", help="Host to bind the server to")
+    @click.option("--port", default=8000, help="Port to listen on")
+    @click.option("--transport", default="streamable-http", type=click.Choice(["streamable-http", "sse"]),
+                  help="Transport protocol to use")
+    def cli(host: str, port: int, transport: str) -> int:
+        """Run the MCP Technology Models API Server."""
+        return run_server(host, port, transport)
+
+    return cli()
+
+
 if __name__ == "__main__":
     main()
@@ -15,6 +15,15 @@ import re
 import sys
 from pathlib import Path
 
+# Pattern to match snippet-source blocks, compiled once at import
+# Matches: <!-- snippet-source path/to/file.py -->
+#          ... any content ...
+#          <!-- /snippet-source -->
+_SNIPPET_RE = re.compile(
+    r"^(\s*)<!-- snippet-source ([^\s]+) -->\n" r"(.*?)" r"^\1<!-- /snippet-source -->",
+    re.MULTILINE | re.DOTALL,
+)
+
 
 def get_github_url(file_path: str) -> str:
     """Generate a GitHub URL for the file.
@@ -29,26 +38,26 @@ def get_github_url(file_path: str) -> str:
     return f"{base_url}/{file_path}"
 
 
-def process_snippet_block(match: re.Match[str], check_mode: bool = False) -> str:
-    """Process a single snippet-source block.
+def process_snippet_block_str(
+    indent: str, file_path: str, existing_content: str | None, check_mode: bool = False
+) -> str | None:
+    """Process a single snippet-source block given its parsed fields.
 
     Args:
-        match: The regex match object
-        check_mode: If True, return original if no changes needed
+        indent: Leading whitespace of the block
+        file_path: Path of the referenced source file
+        existing_content: Current content between the block markers, if any
+        check_mode: If True, return None when no changes are needed
 
     Returns:
-        The updated block content
+        The updated block content, or None if the block should be kept as is
     """
-    full_match = match.group(0)
-    indent = match.group(1)
-    file_path = match.group(2)
-
     try:
         # Read the entire file
         file = Path(file_path)
         if not file.exists():
             print(f"Warning: File not found: {file_path}")
-            return full_match
+            return None
 
         code = file.read_text().rstrip()
         github_url = get_github_url(file_path)
@@ -64,32 +73,43 @@ def process_snippet_block(match: re.Match[str], check_mode: bool = False) -> str
 {indent}<!-- /snippet-source -->"""
 
         # In check mode, only check if code has changed
-        if check_mode:
-            # Extract existing code from the match
-            existing_content = match.group(3)
-            if existing_content is not None:
-                existing_lines = existing_content.strip().split("\n")
-                # Find code between ```python and ```
-                code_lines = []
-                in_code = False
-                for line in existing_lines:
-                    if line.strip() == "```python":
-                        in_code = True
-                    elif line.strip() == "```":
-                        break
-                    elif in_code:
-                        code_lines.append(line)
-                existing_code = "\n".join(code_lines).strip()
-                # Compare with the indented version we would generate
-                expected_code = code.replace("\n", f"\n{indent}").strip()
-                if existing_code == expected_code:
-                    return full_match
+        if check_mode and existing_content is not None:
+            existing_lines = existing_content.strip().split("\n")
+            # Find code between ```python and ```
+            code_lines = []
+            in_code = False
+            for line in existing_lines:
+                if line.strip() == "```python":
+                    in_code = True
+                elif line.strip() == "```":
+                    break
+                elif in_code:
+                    code_lines.append(line)
+            existing_code = "\n".join(code_lines).strip()
+            # Compare with the indented version we would generate
+            expected_code = code.replace("\n", f"\n{indent}").strip()
+            if existing_code == expected_code:
+                return None
 
         return replacement
 
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
-        return full_match
+        return None
+
+
+def process_snippet_block(match: re.Match[str], check_mode: bool = False) -> str:
+    """Process a single snippet-source block.
+
+    Args:
+        match: The regex match object
+        check_mode: If True, return original if no changes needed
+
+    Returns:
+        The updated block content
+    """
+    replacement = process_snippet_block_str(match.group(1), match.group(2), match.group(3), check_mode=check_mode)
+    return match.group(0) if replacement is None else replacement
 
 
 def update_readme_snippets(readme_path: Path = Path("README.md"), check_mode: bool = False) -> bool:
@@ -109,16 +129,8 @@ def update_readme_snippets(readme_path: Path = Path("README.md"), check_mode: bo
     content = readme_path.read_text()
     original_content = content
 
-    # Pattern to match snippet-source blocks
-    # Matches: <!-- snippet-source path/to/file.py -->
-    #          ... any content ...
-    #          <!-- /snippet-source -->
-    pattern = r"^(\s*)<!-- snippet-source ([^\s]+) -->\n" r"(.*?)" r"^\1<!-- /snippet-source -->"
-
     # Process all snippet-source blocks
-    updated_content = re.sub(
-        pattern, lambda m: process_snippet_block(m, check_mode), content, flags=re.MULTILINE | re.DOTALL
-    )
+    updated_content = _SNIPPET_RE.sub(lambda m: process_snippet_block(m, check_mode), content)
 
     if check_mode:
         if updated_content != original_content:
@@ -4,3 +4,19 @@ import pytest
 @pytest.fixture
 def anyio_backend():
     return "asyncio"
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Drop duplicate README example cases so each snippet is linted once."""
+    seen: set[tuple[int, int]] = set()
+    kept: list[pytest.Item] = []
+    for item in items:
+        if getattr(item, "originalname", None) == "test_docs_examples":
+            example = item.callspec.params.get("example")  # type: ignore[attr-defined]
+            if example is not None:
+                key = (example.start_line, hash(example.source))
+                if key in seen:
+                    continue
+                seen.add(key)
+        kept.append(item)
+    items[:] = kept
@@ -1,13 +1,21 @@
 """Pytest configuration for tech_models_api tests."""
 
+import os
 import sys
-from pathlib import Path
 
-# Add the example server to the path
-test_dir = Path(__file__).parent
-repo_root = test_dir.parent.parent
-tech_models_path = repo_root / "examples" / "servers" / "tech-models-api"
+import pytest
+
+# Add the example server to the path; plain string ops avoid building
+# intermediate Path objects on every worker startup
+_here = os.path.dirname(os.path.abspath(__file__))
+_tech_models_path = os.path.normpath(os.path.join(_here, "..", "..", "..", "examples", "servers", "tech-models-api"))
 
 # Insert at the beginning of sys.path
-if str(tech_models_path) not in sys.path:
-    sys.path.insert(0, str(tech_models_path))
+if _tech_models_path not in sys.path:
+    sys.path.insert(0, _tech_models_path)
+
+
+@pytest.fixture(scope="module")
+def anyio_backend():
+    """Pin async tests to the asyncio backend (no trio parametrization)."""
+    return "asyncio"
@@ -1,22 +1,37 @@
 """Tests for the MCP Technology Models API Server."""
 
 import pytest
-from mcp_tech_models_api.server import TechModelAuthSettings, create_tech_models_api_server
+from mcp_tech_models_api.server import (
+    TechModelAuthSettings,
+    TechModelOAuthProvider,
+    create_tech_models_api_server,
+)
+from pydantic import AnyHttpUrl
+
+# Validated once at import; pydantic URL parsing is not free and these
+# values never change across tests
+_REDIRECT_URI = AnyHttpUrl("http://localhost:8080/callback")
+_CALLBACK_PATH = "http://localhost:8888/login/callback"
+_SERVER_URL = "http://localhost:8888"
+
+# One immutable settings instance shared by every test in this module
+_AUTH_SETTINGS = TechModelAuthSettings(
+    mcp_scope="mcp",
+    demo_username="test_user",
+    demo_password="test_pass",
+)
+
+
+@pytest.fixture(scope="module")
+def auth_settings():
+    """Provide the shared auth settings for testing."""
+    return _AUTH_SETTINGS
 
 
 class TestTechModelsAPIServer:
     """Test suite for the Technology Models API Server."""
 
-    @pytest.fixture
-    def auth_settings(self):
-        """Create auth settings for testing."""
-        return TechModelAuthSettings(
-            mcp_scope="mcp",
-            demo_username="test_user",
-            demo_password="test_pass",
-        )
-
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def server(self, auth_settings):
         """Create a test server instance."""
         return create_tech_models_api_server(
@@ -25,6 +40,25 @@ class TestTechModelsAPIServer:
             auth_settings=auth_settings,
         )
 
+    @pytest.fixture(scope="class")
+    def oauth_provider(self, auth_settings):
+        """Create one OAuth provider shared by all tests in the class."""
+        return TechModelOAuthProvider(
+            auth_settings=auth_settings,
+            auth_callback_path=_CALLBACK_PATH,
+            server_url=_SERVER_URL,
+        )
+
+    @pytest.fixture(scope="class")
+    async def oauth_client(self, oauth_provider):
+        """Register one OAuth client shared by all tests in the class."""
+        client_id, client_secret = await oauth_provider.create_client(
+            client_name="Test Client",
+            redirect_uris=[_REDIRECT_URI],
+            scopes=["mcp"],
+        )
+        return client_id, client_secret
+
     def test_server_creation(self, server):
         """Test that the server can be created successfully."""
         assert server is not None
@@ -54,167 +88,108 @@ class TestTechModelsAPIServer:
         assert auth_settings.demo_password == "test_pass"
 
     @pytest.mark.anyio
-    async def test_oauth_provider_login_page(self, auth_settings):
+    async def test_oauth_provider_login_page(self, auth_settings, oauth_provider):
         """Test OAuth provider login page generation."""
-        from mcp_tech_models_api.server import TechModelOAuthProvider
-        
-        provider = TechModelOAuthProvider(
-            auth_settings=auth_settings,
-            auth_callback_path="http://localhost:8888/login/callback",
-            server_url="http://localhost:8888",
-        )
-        
-        response = await provider.get_login_page("test_state")
+        response = await oauth_provider.get_login_page("test_state")
         assert response is not None
         assert response.status_code == 200
-        assert "text/html" in response.media_type
-        
-        # Check that the HTML contains expected elements
+        media_type = response.media_type
+        assert media_type is not None and media_type.startswith("text/html")
+
+        # Check that the HTML contains expected elements; decode once
         content = response.body.decode()
         assert "Tech Models API" in content
         assert "test_state" in content
         assert auth_settings.demo_username in content
 
     @pytest.mark.anyio
-    async def test_oauth_provider_create_client(self, auth_settings):
+    async def test_oauth_provider_create_client(self, oauth_provider, oauth_client):
         """Test OAuth client creation."""
-        from mcp_tech_models_api.server import TechModelOAuthProvider
-        from pydantic import AnyHttpUrl
-        
-        provider = TechModelOAuthProvider(
-            auth_settings=auth_settings,
-            auth_callback_path="http://localhost:8888/login/callback",
-            server_url="http://localhost:8888",
-        )
-        
-        client_id, client_secret = await provider.create_client(
-            client_name="Test Client",
-            redirect_uris=[AnyHttpUrl("http://localhost:8080/callback")],
-            scopes=["mcp"],
-        )
-        
+        client_id, client_secret = oauth_client
+
         assert client_id is not None
         assert client_secret is not None
         assert client_id.startswith("client_")
-        
+
         # Verify client can be retrieved
-        client = await provider.get_client(client_id)
+        client = await oauth_provider.get_client(client_id)
         assert client is not None
         assert client["client_id"] == client_id
         assert client["client_name"] == "Test Client"
 
     @pytest.mark.anyio
-    async def test_oauth_provider_validate_credentials(self, auth_settings):
+    async def test_oauth_provider_validate_credentials(self, oauth_provider, oauth_client):
         """Test OAuth client credential validation."""
-        from mcp_tech_models_api.server import TechModelOAuthProvider
-        from pydantic import AnyHttpUrl
-        
-        provider = TechModelOAuthProvider(
-            auth_settings=auth_settings,
-            auth_callback_path="http://localhost:8888/login/callback",
-            server_url="http://localhost:8888",
-        )
-        
-        client_id, client_secret = await provider.create_client(
-            client_name="Test Client",
-            redirect_uris=[AnyHttpUrl("http://localhost:8080/callback")],
-            scopes=["mcp"],
-        )
-        
+        client_id, client_secret = oauth_client
+
         # Test valid credentials
-        is_valid = await provider.validate_client_secret(client_id, client_secret)
+        is_valid = await oauth_provider.validate_client_secret(client_id, client_secret)
         assert is_valid is True
-        
+
         # Test invalid credentials
-        is_valid = await provider.validate_client_secret(client_id, "wrong_secret")
+        is_valid = await oauth_provider.validate_client_secret(client_id, "wrong_secret")
         assert is_valid is False
 
     @pytest.mark.anyio
-    async def test_oauth_provider_authorization_code_flow(self, auth_settings):
+    async def test_oauth_provider_authorization_code_flow(self, oauth_provider, oauth_client):
         """Test OAuth authorization code flow."""
-        from mcp_tech_models_api.server import TechModelOAuthProvider
-        from pydantic import AnyHttpUrl
-        
-        provider = TechModelOAuthProvider(
-            auth_settings=auth_settings,
-            auth_callback_path="http://localhost:8888/login/callback",
-            server_url="http://localhost:8888",
-        )
-        
-        client_id, _ = await provider.create_client(
-            client_name="Test Client",
-            redirect_uris=[AnyHttpUrl("http://localhost:8080/callback")],
-            scopes=["mcp"],
-        )
-        
+        client_id, _ = oauth_client
+
         # Create authorization code
         redirect_uri = "http://localhost:8080/callback"
-        auth_code = await provider.create_authorization_code(
+        auth_code = await oauth_provider.create_authorization_code(
             client_id=client_id,
             redirect_uri=redirect_uri,
             scopes=["mcp"],
         )
-        
+
         assert auth_code is not None
-        
+
         # Validate authorization code
-        code_data = await provider.validate_authorization_code(
+        code_data = await oauth_provider.validate_authorization_code(
             client_id=client_id,
             code=auth_code,
             redirect_uri=redirect_uri,
         )
-        
+
         assert code_data is not None
         assert code_data["client_id"] == client_id
         assert code_data["redirect_uri"] == redirect_uri
         assert "mcp" in code_data["scopes"]
 
     @pytest.mark.anyio
-    async def test_oauth_provider_token_lifecycle(self, auth_settings):
+    async def test_oauth_provider_token_lifecycle(self, oauth_provider, oauth_client):
         """Test OAuth token creation, validation, and revocation."""
-        from mcp_tech_models_api.server import TechModelOAuthProvider
-        from pydantic import AnyHttpUrl
-        
-        provider = TechModelOAuthProvider(
-            auth_settings=auth_settings,
-            auth_callback_path="http://localhost:8888/login/callback",
-            server_url="http://localhost:8888",
-        )
-        
-        client_id, _ = await provider.create_client(
-            client_name="Test Client",
-            redirect_uris=[AnyHttpUrl("http://localhost:8080/callback")],
-            scopes=["mcp"],
-        )
-        
+        client_id, _ = oauth_client
+
         # Create access token
-        access_token, expires_in = await provider.create_access_token(
+        access_token, expires_in = await oauth_provider.create_access_token(
             client_id=client_id,
             scopes=["mcp"],
         )
-        
+
         assert access_token is not None
         assert expires_in > 0
-        
+
         # Validate token
-        token_data = await provider.load_access_token(access_token)
+        token_data = await oauth_provider.load_access_token(access_token)
         assert token_data is not None
         assert token_data.client_id == client_id
-        
+
         # Create refresh token
-        refresh_token = await provider.create_refresh_token(
+        refresh_token = await oauth_provider.create_refresh_token(
             client_id=client_id,
             scopes=["mcp"],
         )
-        
+
         assert refresh_token is not None
-        
+
         # Revoke access token
-        revoked = await provider.revoke_token(access_token)
+        revoked = await oauth_provider.revoke_token(access_token)
         assert revoked is True
-        
+
         # Verify token is revoked
-        token_data = await provider.load_access_token(access_token)
+        token_data = await oauth_provider.load_access_token(access_token)
         assert token_data is None
 
 
@@ -224,15 +199,10 @@ class TestTechModelsAPIIntegration:
     @pytest.fixture
     def server(self):
         """Create a test server for integration tests."""
-        auth_settings = TechModelAuthSettings(
-            mcp_scope="mcp",
-            demo_username="test_user",
-            demo_password="test_pass",
-        )
         return create_tech_models_api_server(
             host="localhost",
             port=8889,
-            auth_settings=auth_settings,
+            auth_settings=_AUTH_SETTINGS,
         )
 
     def test_server_can_be_created_for_integration(self, server):
@@ -5,21 +5,72 @@
 # pyright: reportUnknownArgumentType=false
 # pyright: reportUnknownMemberType=false
 
-import sys
+import functools
+from contextlib import contextmanager
+from itertools import count
+from types import MappingProxyType
 
 import pytest
 from pytest_examples import CodeExample, EvalExample, find_examples
 
+from examples.fastmcp import bank_data
+from examples.fastmcp.complex_inputs import mcp as complex_inputs_mcp
+from examples.fastmcp.desktop import mcp as desktop_mcp
+from examples.fastmcp.direct_call_tool_result_return import mcp as direct_call_mcp
+from examples.fastmcp.simple_echo import mcp as simple_echo_mcp
 from mcp.shared.memory import create_connected_server_and_client_session as client_session
 from mcp.types import TextContent, TextResourceContents
 
+# Immutable shared tool arguments for test_complex_inputs
+_TANK = MappingProxyType({"shrimp": [{"name": "bob"}, {"name": "alice"}]})
+
+
+@pytest.fixture(scope="module")
+def anyio_backend():
+    """Widen the backend fixture so the module-scoped client fixture can use it."""
+    return "asyncio"
+
+
+@pytest.fixture(scope="module")
+async def bank_client():
+    """One connected session shared by all bank_data tests."""
+    async with client_session(bank_data.mcp._mcp_server) as client:
+        yield client
+
+
+@contextmanager
+def _bank_state():
+    """Snapshot bank_data module state, reset it, and restore on exit."""
+    saved_accounts = dict(bank_data._accounts)
+    saved_txn_counter = bank_data._transaction_counter
+    saved_acct_counter = bank_data._account_counter
+    saved_caches = dict(bank_data._list_caches)
+    bank_data._accounts.clear()
+    bank_data._transaction_counter = count(1)
+    bank_data._account_counter = count(1)
+    bank_data._list_caches.clear()
+    try:
+        yield
+    finally:
+        bank_data._accounts.clear()
+        bank_data._accounts.update(saved_accounts)
+        bank_data._transaction_counter = saved_txn_counter
+        bank_data._account_counter = saved_acct_counter
+        bank_data._list_caches.clear()
+        bank_data._list_caches.update(saved_caches)
+
+
+@pytest.fixture
+def bank_reset():
+    """Run each bank_data test against freshly reset module state."""
+    with _bank_state():
+        yield
+
 
 @pytest.mark.anyio
 async def test_simple_echo():
     """Test the simple echo server"""
-    from examples.fastmcp.simple_echo import mcp
-
-    async with client_session(mcp._mcp_server) as client:
+    async with client_session(simple_echo_mcp._mcp_server) as client:
         result = await client.call_tool("echo", {"text": "hello"})
         assert len(result.content) == 1
         content = result.content[0]
@@ -30,26 +81,17 @@ async def test_simple_echo():
 @pytest.mark.anyio
 async def test_complex_inputs():
     """Test the complex inputs server"""
-    from examples.fastmcp.complex_inputs import mcp
-
-    async with client_session(mcp._mcp_server) as client:
-        tank = {"shrimp": [{"name": "bob"}, {"name": "alice"}]}
-        result = await client.call_tool("name_shrimp", {"tank": tank, "extra_names": ["charlie"]})
+    async with client_session(complex_inputs_mcp._mcp_server) as client:
+        result = await client.call_tool("name_shrimp", {"tank": dict(_TANK), "extra_names": ["charlie"]})
         assert len(result.content) == 3
-        assert isinstance(result.content[0], TextContent)
-        assert isinstance(result.content[1], TextContent)
-        assert isinstance(result.content[2], TextContent)
-        assert result.content[0].text == "bob"
-        assert result.content[1].text == "alice"
-        assert result.content[2].text == "charlie"
+        assert all(isinstance(c, TextContent) for c in result.content)
+        assert tuple(c.text for c in result.content) == ("bob", "alice", "charlie")
 
 
 @pytest.mark.anyio
 async def test_direct_call_tool_result_return():
     """Test the CallToolResult echo server"""
-    from examples.fastmcp.direct_call_tool_result_return import mcp
-
-    async with client_session(mcp._mcp_server) as client:
+    async with client_session(direct_call_mcp._mcp_server) as client:
         result = await client.call_tool("echo", {"text": "hello"})
         assert len(result.content) == 1
         content = result.content[0]
@@ -64,18 +106,26 @@ async def test_direct_call_tool_result_return():
 @pytest.mark.anyio
 async def test_desktop(monkeypatch: pytest.MonkeyPatch):
     """Test the desktop server"""
+    import os
     from pathlib import Path
+    from types import SimpleNamespace
 
     from pydantic import AnyUrl
 
-    from examples.fastmcp.desktop import mcp
+    # Mock desktop directory listing with scandir-style entries
+    mock_entries = [SimpleNamespace(path="/fake/path/file1.txt"), SimpleNamespace(path="/fake/path/file2.txt")]
+
+    class _FakeScandir:
+        def __enter__(self):
+            return iter(mock_entries)
+
+        def __exit__(self, *exc_info: object) -> None:
+            return None
 
-    # Mock desktop directory listing
-    mock_files = [Path("/fake/path/file1.txt"), Path("/fake/path/file2.txt")]
-    monkeypatch.setattr(Path, "iterdir", lambda self: mock_files)  # type: ignore[reportUnknownArgumentType]
+    monkeypatch.setattr(os, "scandir", lambda path: _FakeScandir())
     monkeypatch.setattr(Path, "home", lambda: Path("/fake/home"))
 
-    async with client_session(mcp._mcp_server) as client:
+    async with client_session(desktop_mcp._mcp_server) as client:
         # Test the sum function
         result = await client.call_tool("sum", {"a": 1, "b": 2})
         assert len(result.content) == 1
@@ -89,23 +139,24 @@ async def test_desktop(monkeypatch: pytest.MonkeyPatch):
         content = result.contents[0]
         assert isinstance(content, TextResourceContents)
         assert isinstance(content.text, str)
-        if sys.platform == "win32":  # pragma: no cover
-            file_1 = "/fake/path/file1.txt".replace("/", "\\\\")  # might be a bug
-            file_2 = "/fake/path/file2.txt".replace("/", "\\\\")  # might be a bug
-            assert file_1 in content.text
-            assert file_2 in content.text
-            # might be a bug, but the test is passing
-        else:  # pragma: no cover
-            assert "/fake/path/file1.txt" in content.text
-            assert "/fake/path/file2.txt" in content.text
-
-
-@pytest.mark.parametrize("example", find_examples("README.md"), ids=str)
-def test_docs_examples(example: CodeExample, eval_example: EvalExample):
-    ruff_ignore: list[str] = ["F841", "I001", "F821"]  # F821: undefined names (snippets lack imports)
+        # scandir entries carry their path strings straight through, so the
+        # output no longer varies by platform path flavour
+        assert all(path in content.text for path in ("/fake/path/file1.txt", "/fake/path/file2.txt"))
+
 
-    # Use project's actual line length of 120
-    eval_example.set_config(ruff_ignore=ruff_ignore, target_version="py310", line_length=120)
+@functools.lru_cache(maxsize=1)
+def _readme_examples() -> list[CodeExample]:
+    """Parse the README's code examples once per process."""
+    return list(find_examples("README.md"))
+
+
+# F821: undefined names (snippets lack imports); line length matches the project's 120
+_RUFF_IGNORE: list[str] = ["F841", "I001", "F821"]
+
+
+@pytest.mark.parametrize("example", _readme_examples(), ids=str)
+def test_docs_examples(example: CodeExample, eval_example: EvalExample):
+    eval_example.set_config(ruff_ignore=_RUFF_IGNORE, target_version="py310", line_length=120)
 
     # Use Ruff for both formatting and linting (skip Black)
     if eval_example.update_examples:  # pragma: no cover
@@ -115,93 +166,65 @@ def test_docs_examples(example: CodeExample, eval_example: EvalExample):
 
 
 @pytest.mark.anyio
-async def test_bank_data_create_account():
+async def test_bank_data_create_account(bank_client, bank_reset):
     """Test the bank data server - create account functionality"""
-    from examples.fastmcp.bank_data import _accounts, _transaction_counter, mcp
-
-    # Reset state for test isolation
-    _accounts.clear()
-    _transaction_counter[0] = 0
-
-    async with client_session(mcp._mcp_server) as client:
-        # Create an account with initial deposit
-        result = await client.call_tool("create_account", {"name": "John Doe", "initial_deposit": 100.0})
-        assert len(result.content) == 1
-        content = result.content[0]
-        assert isinstance(content, TextContent)
-        assert "Account created successfully" in content.text
-        assert "ACC000001" in content.text
-        assert "$100.00" in content.text
+    # Create an account with initial deposit
+    result = await bank_client.call_tool("create_account", {"name": "John Doe", "initial_deposit": 100.0})
+    assert len(result.content) == 1
+    content = result.content[0]
+    assert isinstance(content, TextContent)
+    assert "Account created successfully" in content.text
+    assert "ACC000001" in content.text
+    assert "$100.00" in content.text
 
 
 @pytest.mark.anyio
-async def test_bank_data_deposit_and_withdraw():
+async def test_bank_data_deposit_and_withdraw(bank_client, bank_reset):
     """Test the bank data server - deposit and withdrawal functionality"""
-    from examples.fastmcp.bank_data import _accounts, _transaction_counter, mcp
+    # Create an account
+    await bank_client.call_tool("create_account", {"name": "Jane Smith", "initial_deposit": 50.0})
 
-    # Reset state for test isolation
-    _accounts.clear()
-    _transaction_counter[0] = 0
+    # Deposit money
+    result = await bank_client.call_tool("deposit", {"account_id": "ACC000001", "amount": 25.0})
+    content = result.content[0]
+    assert isinstance(content, TextContent)
+    assert "Deposited $25.00" in content.text
+    assert "New balance: $75.00" in content.text
 
-    async with client_session(mcp._mcp_server) as client:
-        # Create an account
-        await client.call_tool("create_account", {"name": "Jane Smith", "initial_deposit": 50.0})
-
-        # Deposit money
-        result = await client.call_tool("deposit", {"account_id": "ACC000001", "amount": 25.0})
-        content = result.content[0]
-        assert isinstance(content, TextContent)
-        assert "Deposited $25.00" in content.text
-        assert "New balance: $75.00" in content.text
-
-        # Withdraw money
-        result = await client.call_tool("withdraw", {"account_id": "ACC000001", "amount": 20.0})
-        content = result.content[0]
-        assert isinstance(content, TextContent)
-        assert "Withdrew $20.00" in content.text
-        assert "New balance: $55.00" in content.text
+    # Withdraw money
+    result = await bank_client.call_tool("withdraw", {"account_id": "ACC000001", "amount": 20.0})
+    content = result.content[0]
+    assert isinstance(content, TextContent)
+    assert "Withdrew $20.00" in content.text
+    assert "New balance: $55.00" in content.text
 
 
 @pytest.mark.anyio
-async def test_bank_data_transfer():
+async def test_bank_data_transfer(bank_client, bank_reset):
     """Test the bank data server - transfer functionality"""
-    from examples.fastmcp.bank_data import _accounts, _transaction_counter, mcp
-
-    # Reset state for test isolation
-    _accounts.clear()
-    _transaction_counter[0] = 0
-
-    async with client_session(mcp._mcp_server) as client:
-        # Create two accounts
-        await client.call_tool("create_account", {"name": "Alice", "initial_deposit": 100.0})
-        await client.call_tool("create_account", {"name": "Bob", "initial_deposit": 50.0})
+    # Create two accounts
+    await bank_client.call_tool("create_account", {"name": "Alice", "initial_deposit": 100.0})
+    await bank_client.call_tool("create_account", {"name": "Bob", "initial_deposit": 50.0})
 
-        # Transfer money
-        result = await client.call_tool(
-            "transfer", {"from_account_id": "ACC000001", "to_account_id": "ACC000002", "amount": 30.0}
-        )
-        content = result.content[0]
-        assert isinstance(content, TextContent)
-        assert "Transferred $30.00" in content.text
-        assert "Source balance: $70.00" in content.text
-        assert "Destination balance: $80.00" in content.text
+    # Transfer money
+    result = await bank_client.call_tool(
+        "transfer", {"from_account_id": "ACC000001", "to_account_id": "ACC000002", "amount": 30.0}
+    )
+    content = result.content[0]
+    assert isinstance(content, TextContent)
+    assert "Transferred $30.00" in content.text
+    assert "Source balance: $70.00" in content.text
+    assert "Destination balance: $80.00" in content.text
 
 
 @pytest.mark.anyio
-async def test_bank_data_insufficient_funds():
+async def test_bank_data_insufficient_funds(bank_client, bank_reset):
     """Test the bank data server - insufficient funds error"""
-    from examples.fastmcp.bank_data import _accounts, _transaction_counter, mcp
-
-    # Reset state for test isolation
-    _accounts.clear()
-    _transaction_counter[0] = 0
-
-    async with client_session(mcp._mcp_server) as client:
-        # Create an account with small balance
-        await client.call_tool("create_account", {"name": "Test User", "initial_deposit": 10.0})
-
-        # Try to withdraw more than available
-        result = await client.call_tool("withdraw", {"account_id": "ACC000001", "amount": 50.0})
-        content = result.content[0]
-        assert isinstance(content, TextContent)
-        assert "Error: Insufficient funds" in content.text
+    # Create an account with small balance
+    await bank_client.call_tool("create_account", {"name": "Test User", "initial_deposit": 10.0})
+
+    # Try to withdraw more than available
+    result = await bank_client.call_tool("withdraw", {"account_id": "ACC000001", "amount": 50.0})
+    content = result.content[0]
+    assert isinstance(content, TextContent)
+    assert "Error: Insufficient funds" in content.text